@@ -1,10 +1,10 @@
 from fastapi import FastAPI, File, UploadFile, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 import os
 from pathlib import Path
 
-app = FastAPI(title="FIR OCR Extraction API")
+app = FastAPI(title="FIR OCR Extraction API", default_response_class=ORJSONResponse)
 
 # CORS configuration
 app.add_middleware(
@@ -19,8 +19,9 @@ app.add_middleware(
 UPLOAD_DIR = Path("uploads")
 MODELS_DIR = Path("trained_models")
 TRAINING_DIR = Path("training_data")
+CACHE_DIR = Path("extraction_cache")
 
-for dir in [UPLOAD_DIR, MODELS_DIR, TRAINING_DIR]:
+for dir in [UPLOAD_DIR, MODELS_DIR, TRAINING_DIR, CACHE_DIR]:
     dir.mkdir(exist_ok=True)
 
 @app.get("/health")
@@ -1,5 +1,6 @@
 from fastapi import APIRouter, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel
 from typing import Dict, Any
 from app.services.training_service import TrainingService
@@ -16,7 +17,9 @@ class TrainingSample(BaseModel):
 @router.post("/sample")
 async def save_training_sample(sample: TrainingSample):
     """Save a corrected extraction as training sample"""
-    success = training_service.save_training_sample(
+    # File writes (and their fsync) run off the event loop
+    success = await run_in_threadpool(
+        training_service.save_training_sample,
         sample.file_id,
         sample.ocr_data,
         sample.corrected_data
@@ -25,16 +28,16 @@ async def save_training_sample(sample: TrainingSample):
     if not success:
         raise HTTPException(status_code=500, detail="Failed to save training sample")
 
-    return JSONResponse(content={"message": "Training sample saved successfully"})
+    return ORJSONResponse(content={"message": "Training sample saved successfully"})
 
 @router.get("/samples")
 async def get_training_samples():
     """Get all training samples"""
-    samples = training_service.get_training_samples()
-    return JSONResponse(content={"samples": samples})
+    samples = await run_in_threadpool(training_service.get_training_samples)
+    return ORJSONResponse(content={"samples": samples})
 
 @router.post("/retrain")
 async def retrain_model():
     """Retrain the extraction model"""
-    result = training_service.retrain_model()
-    return JSONResponse(content=result)
\ No newline at end of file
+    result = await run_in_threadpool(training_service.retrain_model)
+    return ORJSONResponse(content=result)
\ No newline at end of file
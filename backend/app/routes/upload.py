@@ -1,16 +1,50 @@
 from fastapi import APIRouter, File, UploadFile, HTTPException
-from fastapi.responses import JSONResponse, FileResponse
-import shutil
+from fastapi.responses import FileResponse, StreamingResponse
+from fastapi.concurrency import run_in_threadpool
+import aiofiles
+import hashlib
+import logging
+import orjson
+import os
 from pathlib import Path
 import uuid
 from app.services.extraction_service import FIRExtractionService
 from app.services.ocr_service import OCRService
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter()
 
 extraction_service = FIRExtractionService()
 ocr_service = OCRService()
 
+# Size of each chunk streamed from the upload to disk
+UPLOAD_CHUNK_SIZE = 1 << 20
+
+# OCR + extraction results keyed by the BLAKE2 digest of the PDF bytes
+CACHE_DIR = Path("extraction_cache")
+
+# Bump whenever OCR or extraction output changes so stale entries are ignored
+CACHE_VERSION = 2
+
+def stream_json(payload: dict) -> StreamingResponse:
+    """Stream a JSON object, serializing the OCR text_data one page at a time"""
+    def generate():
+        yield b"{"
+        for i, (key, value) in enumerate(payload.items()):
+            yield (b"," if i else b"") + orjson.dumps(key) + b":"
+            if key == "text_data":
+                yield b"{"
+                for j, (page_num, page) in enumerate(value.items()):
+                    yield (b"," if j else b"") + orjson.dumps(str(page_num)) + b":"
+                    yield orjson.dumps(page, option=orjson.OPT_SERIALIZE_NUMPY)
+                yield b"}"
+            else:
+                yield orjson.dumps(value, option=orjson.OPT_SERIALIZE_NUMPY)
+        yield b"}"
+
+    return StreamingResponse(generate(), media_type="application/json")
+
 @router.post("/upload")
 async def upload_and_extract(file: UploadFile = File(...)):
     """Upload PDF and extract FIR data"""
@@ -18,28 +52,68 @@ async def upload_and_extract(file: UploadFile = File(...)):
     if not file.filename.endswith('.pdf'):
         raise HTTPException(status_code=400, detail="Only PDF files are allowed")
 
+    # Reject non-PDF content before it reaches disk or the OCR pipeline
+    if await file.read(5) != b"%PDF-":
+        raise HTTPException(status_code=400, detail="Uploaded file is not a valid PDF")
+    await file.seek(0)
+
     try:
         # Save uploaded file
         file_id = str(uuid.uuid4())
         file_path = Path("uploads") / f"{file_id}.pdf"
 
-        with file_path.open("wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
+        digest = hashlib.blake2b()
+        async with aiofiles.open(file_path, "wb") as buffer:
+            while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                digest.update(chunk)
+                await buffer.write(chunk)
+
+        # Re-uploads of the same PDF skip OCR and extraction
+        cache_path = CACHE_DIR / f"v{CACHE_VERSION}-{digest.hexdigest()}.json"
+        cached = None
+        if cache_path.exists():
+            try:
+                async with aiofiles.open(cache_path, "rb") as f:
+                    cached = orjson.loads(await f.read())
+                text_data = cached["text_data"]
+                extracted_data = cached["extracted_fields"]
+            except (ValueError, KeyError, TypeError):
+                # Unreadable entries are treated as a miss and rewritten
+                cached = None
 
-        # Extract text from PDF
-        try:
-            text_data = ocr_service.extract_text_from_pdf(str(file_path))
-        except Exception as e:
-            print(f"OCR failed: {e}")
-            text_data = {}
+        if cached is None:
+            # Extract text from the first page only, off the event loop
+            try:
+                text_data = await run_in_threadpool(ocr_service.extract_first_page, str(file_path))
+            except Exception as e:
+                print(f"OCR failed: {e}")
+                text_data = {}
 
-        # Extract structured fields from first page
-        if 1 in text_data and text_data[1]:
-            extracted_data = extraction_service.extract_fields(text_data[1])
-        else:
-            extracted_data = {}
+            # Extract structured fields from first page
+            if 1 in text_data and text_data[1]:
+                extracted_data = await run_in_threadpool(extraction_service.extract_fields, text_data[1])
 
-        return JSONResponse(content={
+                # Write to a per-upload temp file and rename it into place, so a
+                # concurrent or later reader never sees a partial entry. The
+                # cache is best-effort and never fails the upload
+                tmp_path = cache_path.with_name(f"{cache_path.name}.{file_id}.tmp")
+                try:
+                    async with aiofiles.open(tmp_path, "wb") as f:
+                        await f.write(orjson.dumps({
+                            "text_data": text_data,
+                            "extracted_fields": extracted_data
+                        }, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY))
+                    os.replace(tmp_path, cache_path)
+                except OSError as e:
+                    logger.warning(f"Could not write extraction cache: {str(e)}")
+                    try:
+                        os.unlink(tmp_path)
+                    except OSError:
+                        pass
+            else:
+                extracted_data = {}
+
+        return stream_json({
             "file_id": file_id,
             "filename": file.filename,
             "text_data": text_data,
@@ -49,6 +123,24 @@ async def upload_and_extract(file: UploadFile = File(...)):
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Processing failed: {str(e)}")
 
+@router.get("/ocr/{file_id}")
+async def get_full_text(file_id: str):
+    """OCR every page of an uploaded PDF"""
+    file_path = Path("uploads") / f"{file_id}.pdf"
+
+    if not file_path.exists():
+        raise HTTPException(status_code=404, detail="File not found")
+
+    try:
+        text_data = await run_in_threadpool(ocr_service.extract_text_from_pdf, str(file_path))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Processing failed: {str(e)}")
+
+    return stream_json({
+        "file_id": file_id,
+        "text_data": text_data
+    })
+
 @router.get("/file/{file_id}")
 async def get_file(file_id: str):
     """Get uploaded PDF file"""
@@ -1,9 +1,257 @@
+import functools
+import json
 import re
+from pathlib import Path
 from typing import Dict, List, Any
 import logging
 
+try:
+    import re2  # optional google-re2 engine for the label patterns
+except ImportError:
+    re2 = None
+
 logger = logging.getLogger(__name__)
 
+# Common OCR corrections for FIR documents
+_OCR_CORRECTIONS = {
+    'Fste@': 'District',
+    '((aRT': 'Police Station',
+    'Sot)': 'Station',
+    'staTst': 'Station',
+    'AeT@oat': 'Monday',
+    '2X': '2 hours',
+    'STfeT': 'Street',
+    '3fex)': 'Street',
+    'TTA,': 'Street',
+    '1 Tee aA.': '1 km approx',
+    '{81': 'House No',
+    'Stel': 'Street',
+    'HAN,': 'Hanuman',
+    'caleit': 'Colony',
+    'Stec,,': 'Street',
+    'VoSITENs,,': 'Vishnu Nagar',
+    'ailurst,': 'Ailur',
+    'SMT': 'Street',
+    'Orel': 'Shri',
+    'galetaR': 'Gautam',
+    '6971': '1997',
+    'ASAT': 'Street',
+    'dash)': 'District',
+    'Ariédt': 'Address',
+    'fAreatearan)': 'Father/Husband',
+    'Saal': 'Shri',
+    'Fel': 'Shri',
+    'SAeaa,': 'Shri',
+    'Welk': 'Shri',
+    'sear': 'Shri',
+    'ara)': 'Name',
+    'feat:': 'Date',
+    '3itet': 'Street',
+    'create:': 'District',
+    'Rear': 'Present',
+    'Ze.': 'No.',
+    'det': 'Present',
+    'PATTON': 'Present',
+    'feet': 'Address',
+    'Pwr': 'Present',
+    'faerard': 'Address',
+    'HR': 'House',
+    'Aelaeael': 'Address',
+    'Tat': 'Street',
+    'TAT': 'Street',
+    'caret': 'Street',
+    'attests': 'Address',
+    'Yael': 'Street',
+    '3a': 'No',
+    'ed': 'No',
+    '3teTstscla': 'Address',
+    'let': 'No',
+    'USAT': 'Present',
+    'WEN': 'Address',
+    'seer': 'Shri',
+    'HAT': 'Street',
+    'att': 'Street',
+    'Hace': 'House',
+    'FeV': 'No',
+    'Als': 'No',
+    'cared': 'Street',
+    'Taweg': 'Street',
+    'SN.UeT.UE.HoAA': 'S.No.',
+    'IL': 'Shri',
+    'SOTA': 'Shri',
+    'THA': 'Street',
+    'Mee': 'Street',
+    'SA': 'Street',
+    'GOR': 'Street',
+    'Use': 'No',
+    'TAR': 'Street',
+    'ah': 'No',
+    'fate': 'Street',
+    'act': 'No',
+    'fe,': 'No',
+    'Ure': 'Present',
+    'AT': 'No',
+    'Udit': 'Shri',
+    'Tale': 'Shri',
+    'aired': 'Shri',
+    'ale': 'Shri',
+    'Aaell': 'Shri',
+    'asa)': 'Name',
+    'He': 'No',
+}
+
+# Match all corrections in a single pass; longer keys first so they win
+_OCR_CORRECTIONS_RE = re.compile('|'.join(
+    re.escape(k) for k in sorted(_OCR_CORRECTIONS, key=len, reverse=True)
+))
+
+# Skeleton of the extraction result, built as a literal for every document
+def _empty_result() -> Dict[str, Any]:
+    """Return a fresh extract_fields result with every field empty"""
+    return {
+        'FIR': {
+            'District': '',
+            'PoliceStation': '',
+            'Year': 0,
+            'FIRNo': '',
+            'DateTimeOfFIR': '',
+            'ActsSections': [],
+            'OccurrenceOfOffence': {
+                'Day': '',
+                'DateFrom': '',
+                'DateTo': '',
+                'TimePeriod': '',
+                'TimeFrom': '',
+                'TimeTo': ''
+            },
+            'InfoReceivedAtPS': {
+                'Date': '',
+                'Time': ''
+            },
+            'GeneralDiaryReference': {
+                'EntryNo': '',
+                'DateTime': ''
+            },
+            'TypeOfInformation': '',
+            'PlaceOfOccurrence': {
+                'DirectionDistanceFromPS': {
+                    'Direction': '',
+                    'Distance': ''
+                },
+                'BeatNo': '',
+                'Address': '',
+                'DistrictState': ''
+            }
+        },
+        'ComplainantInformant': {
+            'Name': '',
+            'FatherOrHusbandName': '',
+            'DOB_YearOfBirth': '',
+            'Nationality': 'भारत',
+            'UIDNo': '',
+            'PassportNo': '',
+            'IDDetails': [],
+            'Occupation': '',
+            'Addresses': [],
+            'PhoneNumber': ''
+        },
+        'AccusedDetails': [],
+        'PropertyOfInterest': [],
+        'TotalValueOfPropertyInRs': '',
+        'Inquest_UDB_CaseNo': [],
+        'FirstInformationContents': '',
+        'ActionTaken': {
+            'RegisteredCaseInvestigation': {
+                'OfficerName': '',
+                'Rank': '',
+                'No': ''
+            },
+            'DirectedNameOfIO': '',
+            'DirectedRank': '',
+            'DirectedNo': '',
+            'RefusedInvestigationDueTo': '',
+            'TransferredPS': '',
+            'TransferredDistrict': '',
+            'ROAC': ''
+        },
+        'ComplainantSignature': {
+            'Name': '',
+            'Rank': '',
+            'No': ''
+        },
+        'DateTimeOfDispatchToCourt': '',
+        'AccusedPhysicalDetails': []
+    }
+
+# Case-folded literals, at least one of which must occur for a pattern to match
+_ANCHORS = {
+    'fir_no': ('fir',),
+    'district_inline': ('district',),
+    'ps_inline': ('p.s.', 'police station'),
+    'name': ('name',),
+    'father': ('father', 'husband'),
+    'dob': ('dob', 'birth'),
+    'complainant_address': ('address',),
+    'day': ('day',),
+    'time_period': ('period',),
+    'section': ('section', 'bns'),
+    'direction': ('direction',),
+    'distance': ('distance',),
+    'beat': ('beat',),
+    'address': ('address',),
+    'officer': ('officer', 'name'),
+    'rank': ('rank',),
+    'no': ('no',),
+    'first_info': ('first', 'प्रथम'),
+    'accused': ('accused', 'आरोपी'),
+}
+
+def _compile_label(pattern: str, dotall: bool = False):
+    """Compile a keyword-anchored label pattern, using RE2 when available"""
+    # Label patterns avoid \w/\d (ASCII-only in RE2) and the joined OCR text only
+    # contains plain spaces, so RE2 matches them identically in linear time
+    flags = '(?is)' if dotall else '(?i)'
+    if re2 is not None:
+        return re2.compile(flags + pattern)
+    return re.compile(flags + pattern)
+
+# Regexes used by the field extractors, compiled once per process
+_COMPILED = {
+    'noise': re.compile(r'[^\w\s.,:/()-]'),
+    'spaces': re.compile(r'\s+'),
+    'non_word': re.compile(r'[^\w\s]'),
+    'fir_no': re.compile(r'FIR.*?(\d{4})', re.IGNORECASE),
+    'date_time': re.compile(r'(\d{2}/\d{2}/\d{4})\s*(\d{2}:\d{2})'),
+    'district_inline': _compile_label(r'District.*?:(.*?)(?:\s*Police|\s*Station|\s*Year|\s*$)'),
+    'ps_inline': _compile_label(r'(?:P\.S\.|Police Station).*?:(.*?)(?:\s*Year|\s*$)'),
+    'digit_run': re.compile(r'\d{4,}'),
+    'name': _compile_label(r'Name.*?:(.*?)(?:\s*Father|\s*DOB|\s*Date|\s*$)'),
+    'father': _compile_label(r'(?:Father|Husband).*?(?:Name).*?:(.*?)(?:\s*DOB|\s*Date|\s*$)'),
+    'dob': re.compile(r'(?:DOB|Birth).*?(\d{4})', re.IGNORECASE),
+    'complainant_address': _compile_label(r'Address.*?:(.*?)(?:\s*Phone|\s*Mobile|\s*$)'),
+    'day': _compile_label(r'Day.*?:(.*?)(?:\s*Date|\s*$)'),
+    'dates_all': re.compile(r'(\d{2}/\d{2}/\d{4})'),
+    'time_period': _compile_label(r'Time.*?Period.*?:(.*?)(?:\s*Time|\s*$)'),
+    'times_all': re.compile(r'(\d{2}:\d{2})'),
+    'section': re.compile(r'(?:Section|BNS).*?(\d+)', re.IGNORECASE),
+    'section_number': re.compile(r'\b(\d{2,3})\b'),
+    'direction': _compile_label(r'Direction.*?:(.*?)(?:\s*Distance|\s*Beat|\s*$)'),
+    'distance': _compile_label(r'Distance.*?:(.*?)(?:\s*Beat|\s*Address|\s*$)'),
+    'beat': _compile_label(r'Beat.*?:(.*?)(?:\s*Address|\s*$)'),
+    'address': _compile_label(r'Address.*?:(.*?)(?:\s*District|\s*State|\s*$)'),
+    'officer': _compile_label(r'(?:Officer|Name).*?:(.*?)(?:\s*Rank|\s*$)'),
+    'rank': _compile_label(r'Rank.*?:(.*?)(?:\s*No|\s*$)'),
+    'no': _compile_label(r'No.*?:(.*?)(?:\s*$)'),
+    'first_info': _compile_label(r'(?:First\s*Information\s*Contents|प्रथम\s*खबर\s*अंतर्गत).*?:(.*?)(?:Action\s*Taken|$)', dotall=True),
+    'accused': _compile_label(r'(?:Accused|आरोपी).*?(?:Name|नाव).*?:(.*?)(?:Alias|उपनाव|$)'),
+}
+
+@functools.lru_cache(maxsize=1)
+def _read_improved_patterns(path: str, mtime_ns: int) -> Dict[str, str]:
+    """Parse the improved patterns file, re-reading only when its mtime changes"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
 class FIRExtractionService:
     def __init__(self):
         """Initialize extraction patterns for FIR fields"""
@@ -28,229 +276,68 @@ class FIRExtractionService:
             'officer_no': r'No\.\s*:\s*(.*?)(?:\s*$)',
         }
 
+        # Precompiled regexes used by the field extractors
+        self._compiled = _COMPILED
+
         # Load improved patterns if available
         self._load_improved_patterns()
     
     def extract_fields(self, ocr_data: List[Dict]) -> Dict[str, Any]:
         """Extract structured fields from OCR data"""
         # Filter out low-confidence OCR text and clean it
-        filtered_ocr = [item for item in ocr_data if item.get('confidence', 0) > 0.3]
-        cleaned_ocr = self._clean_ocr_text(filtered_ocr)
+        texts = self._clean_ocr_text(ocr_data)
 
         # Combine all cleaned text
-        full_text = ' '.join([item['text'] for item in cleaned_ocr])
-
-        extracted_fields = {
-            'FIR': {
-                'District': '',
-                'PoliceStation': '',
-                'Year': 0,
-                'FIRNo': '',
-                'DateTimeOfFIR': '',
-                'ActsSections': [],
-                'OccurrenceOfOffence': {
-                    'Day': '',
-                    'DateFrom': '',
-                    'DateTo': '',
-                    'TimePeriod': '',
-                    'TimeFrom': '',
-                    'TimeTo': ''
-                },
-                'InfoReceivedAtPS': {
-                    'Date': '',
-                    'Time': ''
-                },
-                'GeneralDiaryReference': {
-                    'EntryNo': '',
-                    'DateTime': ''
-                },
-                'TypeOfInformation': '',
-                'PlaceOfOccurrence': {
-                    'DirectionDistanceFromPS': {
-                        'Direction': '',
-                        'Distance': ''
-                    },
-                    'BeatNo': '',
-                    'Address': '',
-                    'DistrictState': ''
-                }
-            },
-            'ComplainantInformant': {
-                'Name': '',
-                'FatherOrHusbandName': '',
-                'DOB_YearOfBirth': '',
-                'Nationality': 'भारत',
-                'UIDNo': '',
-                'PassportNo': '',
-                'IDDetails': [],
-                'Occupation': '',
-                'Addresses': [],
-                'PhoneNumber': ''
-            },
-            'AccusedDetails': [],
-            'PropertyOfInterest': [],
-            'TotalValueOfPropertyInRs': '',
-            'Inquest_UDB_CaseNo': [],
-            'FirstInformationContents': '',
-            'ActionTaken': {
-                'RegisteredCaseInvestigation': {
-                    'OfficerName': '',
-                    'Rank': '',
-                    'No': ''
-                },
-                'DirectedNameOfIO': '',
-                'DirectedRank': '',
-                'DirectedNo': '',
-                'RefusedInvestigationDueTo': '',
-                'TransferredPS': '',
-                'TransferredDistrict': '',
-                'ROAC': ''
-            },
-            'ComplainantSignature': {
-                'Name': '',
-                'Rank': '',
-                'No': ''
-            },
-            'DateTimeOfDispatchToCourt': '',
-            'AccusedPhysicalDetails': []
-        }
+        full_text = ' '.join(texts)
+
+        # Case-folded copy used to skip patterns whose keywords are absent
+        folded = full_text.casefold()
+
+        # Collect the year/phone/UID digit runs in a single scan
+        numbers = self._scan_numbers(full_text)
+
+        extracted_fields = _empty_result()
 
         try:
             # Extract FIR basic info
-            extracted_fields['FIR'].update(self._extract_fir_info(cleaned_ocr, full_text))
+            extracted_fields['FIR'].update(self._extract_fir_info(texts, full_text, folded, numbers))
 
             # Extract complainant details
-            extracted_fields['ComplainantInformant'].update(self._extract_complainant(cleaned_ocr, full_text))
+            extracted_fields['ComplainantInformant'].update(self._extract_complainant(texts, full_text, folded, numbers))
 
             # Extract accused details
-            extracted_fields['AccusedDetails'] = self._extract_accused(cleaned_ocr)
+            extracted_fields['AccusedDetails'] = self._extract_accused(texts, full_text, folded)
 
             # Extract occurrence details
-            extracted_fields['FIR']['OccurrenceOfOffence'] = self._extract_occurrence(cleaned_ocr, full_text)
+            extracted_fields['FIR']['OccurrenceOfOffence'] = self._extract_occurrence(texts, full_text, folded)
 
             # Extract acts and sections
-            extracted_fields['FIR']['ActsSections'] = self._extract_acts_sections(cleaned_ocr, full_text)
+            extracted_fields['FIR']['ActsSections'] = self._extract_acts_sections(texts, full_text, folded)
 
             # Extract place of occurrence
-            extracted_fields['FIR']['PlaceOfOccurrence'] = self._extract_place(cleaned_ocr, full_text)
+            extracted_fields['FIR']['PlaceOfOccurrence'] = self._extract_place(texts, full_text, folded)
 
             # Extract action taken
-            extracted_fields['ActionTaken'] = self._extract_action_taken(cleaned_ocr, full_text)
+            extracted_fields['ActionTaken'] = self._extract_action_taken(texts, full_text, folded)
 
             # Extract first information contents
-            extracted_fields['FirstInformationContents'] = self._extract_first_information(cleaned_ocr, full_text)
+            extracted_fields['FirstInformationContents'] = self._extract_first_information(texts, full_text, folded)
 
         except Exception as e:
             logger.error(f"Field extraction failed: {str(e)}")
 
         return extracted_fields
 
-    def _clean_ocr_text(self, ocr_data: List[Dict]) -> List[Dict]:
-        """Clean OCR text by removing noise and correcting common OCR errors"""
-        cleaned_data = []
-
-        # Common OCR corrections for FIR documents
-        corrections = {
-            'Fste@': 'District',
-            '((aRT': 'Police Station',
-            'Sot)': 'Station',
-            'staTst': 'Station',
-            'AeT@oat': 'Monday',
-            '2X': '2 hours',
-            'STfeT': 'Street',
-            '3fex)': 'Street',
-            'TTA,': 'Street',
-            '1 Tee aA.': '1 km approx',
-            '{81': 'House No',
-            'Stel': 'Street',
-            'HAN,': 'Hanuman',
-            'caleit': 'Colony',
-            'Stec,,': 'Street',
-            'VoSITENs,,': 'Vishnu Nagar',
-            'ailurst,': 'Ailur',
-            'SMT': 'Street',
-            'Orel': 'Shri',
-            'galetaR': 'Gautam',
-            '6971': '1997',
-            'ASAT': 'Street',
-            'dash)': 'District',
-            'Ariédt': 'Address',
-            'fAreatearan)': 'Father/Husband',
-            'Saal': 'Shri',
-            'Fel': 'Shri',
-            'SAeaa,': 'Shri',
-            'Welk': 'Shri',
-            'sear': 'Shri',
-            'ara)': 'Name',
-            'feat:': 'Date',
-            '3itet': 'Street',
-            '3fex)': 'Street',
-            'TTA,': 'Street',
-            '1 Tee aA.': '1 km approx',
-            'create:': 'District',
-            '3itet': 'Street',
-            'Rear': 'Present',
-            'Ze.': 'No.',
-            'det': 'Present',
-            'Ze.': 'No.',
-            'PATTON': 'Present',
-            'feet': 'Address',
-            'Pwr': 'Present',
-            'faerard': 'Address',
-            'HR': 'House',
-            'Aelaeael': 'Address',
-            'Tat': 'Street',
-            'TAT': 'Street',
-            'caret': 'Street',
-            'attests': 'Address',
-            'Yael': 'Street',
-            '3a': 'No',
-            'ed': 'No',
-            '3teTstscla': 'Address',
-            'let': 'No',
-            'USAT': 'Present',
-            'WEN': 'Address',
-            'seer': 'Shri',
-            'HAT': 'Street',
-            'att': 'Street',
-            'Hace': 'House',
-            'TAT': 'Street',
-            'FeV': 'No',
-            'Als': 'No',
-            'cared': 'Street',
-            'Taweg': 'Street',
-            'SN.UeT.UE.HoAA': 'S.No.',
-            'IL': 'Shri',
-            'SOTA': 'Shri',
-            'THA': 'Street',
-            'Mee': 'Street',
-            'SA': 'Street',
-            'GOR': 'Street',
-            'Use': 'No',
-            'TAR': 'Street',
-            'ah': 'No',
-            'fate': 'Street',
-            'act': 'No',
-            'fe,': 'No',
-            'Ure': 'Present',
-            'AT': 'No',
-            'Udit': 'Shri',
-            'Tale': 'Shri',
-            'aired': 'Shri',
-            'ale': 'Shri',
-            'Aaell': 'Shri',
-            'asa)': 'Name',
-            'He': 'No',
-            'AT': 'No',
-            'Udit': 'Shri',
-            'Tale': 'Shri',
-            'aired': 'Shri',
-            'ale': 'Shri',
-            'Aaell': 'Shri',
-            'asa)': 'Name',
-        }
+    def _clean_ocr_text(self, ocr_data: List[Dict], min_conf: float = 0.3) -> List[str]:
+        """Drop low-confidence OCR items, remove noise and correct common OCR errors"""
+        # Extractors only read the text, so the per-item dicts are not rebuilt
+        cleaned_texts = []
 
         for item in ocr_data:
+            # Skip low-confidence detections
+            if item.get('confidence', 0) <= min_conf:
+                continue
+
             text = item['text'].strip()
 
             # Skip very short or empty text
@@ -258,59 +345,81 @@ class FIRExtractionService:
                 continue
 
             # Remove noise characters
-            text = re.sub(r'[^\w\s.,:/()-]', '', text)
+            text = self._compiled['noise'].sub('', text)
 
             # Apply corrections
-            for ocr_error, correction in corrections.items():
-                text = text.replace(ocr_error, correction)
+            text = _OCR_CORRECTIONS_RE.sub(lambda m: _OCR_CORRECTIONS[m.group(0)], text)
 
             # Clean up multiple spaces
-            text = re.sub(r'\s+', ' ', text).strip()
+            text = self._compiled['spaces'].sub(' ', text).strip()
 
             if text:
-                cleaned_data.append({
-                    'text': text,
-                    'confidence': item.get('confidence', 0),
-                    'bbox': item.get('bbox', [])
-                })
-
-        return cleaned_data
-
-    def _extract_fir_info(self, ocr_data: List[Dict], full_text: str) -> Dict:
+                cleaned_texts.append(text)
+
+        return cleaned_texts
+
+    def _search(self, name: str, full_text: str, folded: str):
+        """Search with a compiled pattern only if one of its keywords occurs"""
+        if not any(anchor in folded for anchor in _ANCHORS[name]):
+            return None
+        return self._compiled[name].search(full_text)
+
+    def _findall(self, name: str, full_text: str, folded: str) -> List:
+        """Find all matches of a compiled pattern only if one of its keywords occurs"""
+        if not any(anchor in folded for anchor in _ANCHORS[name]):
+            return []
+        return self._compiled[name].findall(full_text)
+
+    def _scan_numbers(self, full_text: str) -> Dict[str, str]:
+        """Find the first 4-, 10- and 12-digit numbers in one pass over the text"""
+        numbers = {}
+
+        # The first run of at least N digits starts the first N-digit match
+        for match in self._compiled['digit_run'].finditer(full_text):
+            run = match.group(0)
+            for name, length in (('year', 4), ('mobile', 10), ('uid', 12)):
+                if name not in numbers and len(run) >= length:
+                    numbers[name] = run[:length]
+            if len(numbers) == 3:
+                break
+
+        return numbers
+
+    def _extract_fir_info(self, texts: List[str], full_text: str, folded: str,
+                          numbers: Dict[str, str]) -> Dict:
         """Extract basic FIR information"""
-        fir_info = {}
+        fir_info: Dict[str, Any] = {}
 
         # Extract FIR number - look for 4-digit numbers after FIR patterns
-        fir_match = re.search(r'FIR.*?(\d{4})', full_text, re.IGNORECASE)
+        fir_match = self._search('fir_no', full_text, folded)
         if fir_match:
             fir_info['FIRNo'] = fir_match.group(1)
 
         # Extract date and time of FIR - look for date/time patterns
-        date_match = re.search(r'(\d{2}/\d{2}/\d{4})\s*(\d{2}:\d{2})', full_text)
+        date_match = self._compiled['date_time'].search(full_text)
         if date_match:
             fir_info['DateTimeOfFIR'] = f"{date_match.group(1)} {date_match.group(2)}"
 
         # Extract district - look for "District" followed by text
-        district_match = re.search(r'District.*?:(.*?)(?:\s*Police|\s*Station|\s*Year|\s*$)', full_text, re.IGNORECASE)
+        district_match = self._search('district_inline', full_text, folded)
         if district_match:
             district = district_match.group(1).strip()
             # Clean up and take reasonable length
-            district = re.sub(r'[^\w\s]', '', district).strip()
+            district = self._compiled['non_word'].sub('', district).strip()
             if len(district) > 2 and len(district) < 50:
                 fir_info['District'] = district
 
         # Extract police station - look for "P.S." or "Police Station"
-        ps_match = re.search(r'(?:P\.S\.|Police Station).*?:(.*?)(?:\s*Year|\s*$)', full_text, re.IGNORECASE)
+        ps_match = self._search('ps_inline', full_text, folded)
         if ps_match:
             ps = ps_match.group(1).strip()
-            ps = re.sub(r'[^\w\s]', '', ps).strip()
+            ps = self._compiled['non_word'].sub('', ps).strip()
             if len(ps) > 2 and len(ps) < 50:
                 fir_info['PoliceStation'] = ps
 
         # Extract year - look for 4-digit year
-        year_match = re.search(r'(\d{4})', full_text)
-        if year_match:
-            year = int(year_match.group(1))
+        if 'year' in numbers:
+            year = int(numbers['year'])
             if 2000 <= year <= 2030:  # Reasonable year range
                 fir_info['Year'] = year
 
@@ -323,9 +432,10 @@ class FIRExtractionService:
         return fir_info
     
     
-    def _extract_complainant(self, ocr_data: List[Dict], full_text: str) -> Dict:
+    def _extract_complainant(self, texts: List[str], full_text: str, folded: str,
+                             numbers: Dict[str, str]) -> Dict:
         """Extract complainant information"""
-        complainant = {
+        complainant: Dict[str, Any] = {
             'Name': '',
             'FatherOrHusbandName': '',
             'DOB_YearOfBirth': '',
@@ -339,38 +449,36 @@ class FIRExtractionService:
         }
 
         # Extract name - look for text after "Name" in complainant section
-        name_match = re.search(r'Name.*?:(.*?)(?:\s*Father|\s*DOB|\s*Date|\s*$)', full_text, re.IGNORECASE)
+        name_match = self._search('name', full_text, folded)
         if name_match:
             name = name_match.group(1).strip()
             if len(name) > 2 and len(name) < 100:
                 complainant['Name'] = name
 
         # Extract father's/husband's name
-        father_match = re.search(r'(?:Father|Husband).*?(?:Name).*?:(.*?)(?:\s*DOB|\s*Date|\s*$)', full_text, re.IGNORECASE)
+        father_match = self._search('father', full_text, folded)
         if father_match:
             father_name = father_match.group(1).strip()
             if len(father_name) > 2 and len(father_name) < 100:
                 complainant['FatherOrHusbandName'] = father_name
 
         # Extract DOB/Year of birth - look for 4-digit years in reasonable range
-        dob_match = re.search(r'(?:DOB|Birth).*?(\d{4})', full_text, re.IGNORECASE)
+        dob_match = self._search('dob', full_text, folded)
         if dob_match:
             year = int(dob_match.group(1))
             if 1900 <= year <= 2010:  # Reasonable birth year range
                 complainant['DOB_YearOfBirth'] = str(year)
 
         # Extract mobile number - look for 10-digit numbers
-        mobile_match = re.search(r'(\d{10})', full_text)
-        if mobile_match:
-            complainant['PhoneNumber'] = mobile_match.group(1)
+        if 'mobile' in numbers:
+            complainant['PhoneNumber'] = numbers['mobile']
 
         # Extract UID number - look for 12-digit numbers
-        uid_match = re.search(r'(\d{12})', full_text)
-        if uid_match:
-            complainant['UIDNo'] = uid_match.group(1)
+        if 'uid' in numbers:
+            complainant['UIDNo'] = numbers['uid']
 
         # Extract addresses - look for address patterns
-        address_match = re.search(r'Address.*?:(.*?)(?:\s*Phone|\s*Mobile|\s*$)', full_text, re.IGNORECASE)
+        address_match = self._search('complainant_address', full_text, folded)
         if address_match:
             address = address_match.group(1).strip()
             if len(address) > 5 and len(address) < 200:
@@ -378,56 +486,20 @@ class FIRExtractionService:
 
         return complainant
     
-    def _extract_accused(self, ocr_data: List[Dict]) -> List[Dict]:
-        """Extract accused details"""
-        accused_list = []
-        
-        # Find accused section
-        accused_started = False
-        current_accused = None
-        
-        for item in ocr_data:
-            text = item['text']
-            
-            if 'Accused' in text or 'आरोपी' in text:
-                accused_started = True
-                if current_accused:
-                    accused_list.append(current_accused)
-                current_accused = {
-                    'Name': '',
-                    'Alias': '',
-                    'RelativeName': '',
-                    'PresentAddress': ''
-                }
-            elif accused_started and current_accused:
-                # Extract accused details
-                if 'Name' in text or 'नाव' in text:
-                    # Next item likely has the name
-                    continue
-                elif text and len(text) > 3 and not current_accused['Name']:
-                    current_accused['Name'] = text
-        
-        if current_accused and current_accused['Name']:
-            accused_list.append(current_accused)
-        
-        return accused_list
-
     def _load_improved_patterns(self):
         """Load improved patterns from training data"""
         try:
-            from pathlib import Path
-            import json
-
             pattern_file = Path("training_data") / "improved_patterns.json"
             if pattern_file.exists():
-                with pattern_file.open('r', encoding='utf-8') as f:
-                    improved_patterns = json.load(f)
-                    self.patterns.update(improved_patterns)
-                    logger.info(f"Loaded {len(improved_patterns)} improved patterns")
+                improved_patterns = _read_improved_patterns(
+                    str(pattern_file), pattern_file.stat().st_mtime_ns
+                )
+                self.patterns.update(improved_patterns)
+                logger.info(f"Loaded {len(improved_patterns)} improved patterns")
         except Exception as e:
             logger.warning(f"Could not load improved patterns: {str(e)}")
     
-    def _extract_occurrence(self, ocr_data: List[Dict], full_text: str) -> Dict:
+    def _extract_occurrence(self, texts: List[str], full_text: str, folded: str) -> Dict:
         """Extract occurrence details"""
         occurrence = {
             'Day': '',
@@ -439,41 +511,45 @@ class FIRExtractionService:
         }
 
         # Extract day - look for day names
-        day_match = re.search(r'Day.*?:(.*?)(?:\s*Date|\s*$)', full_text, re.IGNORECASE)
+        day_match = self._search('day', full_text, folded)
         if day_match:
             day = day_match.group(1).strip()
             if len(day) > 2 and len(day) < 20:
                 occurrence['Day'] = day
 
-        # Extract dates - look for date patterns
-        dates = re.findall(r'(\d{2}/\d{2}/\d{4})', full_text)
-        if len(dates) >= 1:
-            occurrence['DateFrom'] = dates[0]
-        if len(dates) >= 2:
-            occurrence['DateTo'] = dates[1]
+        # Extract dates - only the first two date patterns are used
+        dates = self._compiled['dates_all'].finditer(full_text)
+        date_from = next(dates, None)
+        if date_from:
+            occurrence['DateFrom'] = date_from.group(1)
+            date_to = next(dates, None)
+            if date_to:
+                occurrence['DateTo'] = date_to.group(1)
 
         # Extract time period - look for time-related text
-        time_period_match = re.search(r'Time.*?Period.*?:(.*?)(?:\s*Time|\s*$)', full_text, re.IGNORECASE)
+        time_period_match = self._search('time_period', full_text, folded)
         if time_period_match:
             period = time_period_match.group(1).strip()
             if len(period) > 1 and len(period) < 50:
                 occurrence['TimePeriod'] = period
 
-        # Extract times - look for time patterns
-        times = re.findall(r'(\d{2}:\d{2})', full_text)
-        if len(times) >= 1:
-            occurrence['TimeFrom'] = times[0]
-        if len(times) >= 2:
-            occurrence['TimeTo'] = times[1]
+        # Extract times - only the first two time patterns are used
+        times = self._compiled['times_all'].finditer(full_text)
+        time_from = next(times, None)
+        if time_from:
+            occurrence['TimeFrom'] = time_from.group(1)
+            time_to = next(times, None)
+            if time_to:
+                occurrence['TimeTo'] = time_to.group(1)
 
         return occurrence
     
-    def _extract_acts_sections(self, ocr_data: List[Dict], full_text: str) -> List[Dict]:
+    def _extract_acts_sections(self, texts: List[str], full_text: str, folded: str) -> List[Dict]:
         """Extract acts and sections"""
         acts_sections = []
 
         # Look for section numbers in the text
-        section_matches = re.findall(r'(?:Section|BNS).*?(\d+)', full_text, re.IGNORECASE)
+        section_matches = self._findall('section', full_text, folded)
         for section in section_matches:
             acts_sections.append({
                 'Act': 'भारतीय न्याय संहिता (बी एन एस), 2023',
@@ -483,8 +559,8 @@ class FIRExtractionService:
         # If no sections found, look for any standalone numbers that might be sections
         if not acts_sections:
             # Look for patterns like "173" in the context of acts
-            potential_sections = re.findall(r'\b(\d{2,3})\b', full_text)
-            for num in potential_sections:
+            for match in self._compiled['section_number'].finditer(full_text):
+                num = match.group(1)
                 num_int = int(num)
                 if 100 <= num_int <= 511:  # Reasonable section number range
                     acts_sections.append({
@@ -495,9 +571,9 @@ class FIRExtractionService:
 
         return acts_sections
     
-    def _extract_place(self, ocr_data: List[Dict], full_text: str) -> Dict:
+    def _extract_place(self, texts: List[str], full_text: str, folded: str) -> Dict:
         """Extract place of occurrence"""
-        place = {
+        place: Dict[str, Any] = {
             'DirectionDistanceFromPS': {
                 'Direction': '',
                 'Distance': ''
@@ -508,28 +584,28 @@ class FIRExtractionService:
         }
 
         # Extract direction and distance - look for patterns in place section
-        direction_match = re.search(r'Direction.*?:(.*?)(?:\s*Distance|\s*Beat|\s*$)', full_text, re.IGNORECASE)
+        direction_match = self._search('direction', full_text, folded)
         if direction_match:
             direction = direction_match.group(1).strip()
             if len(direction) > 2 and len(direction) < 100:
                 place['DirectionDistanceFromPS']['Direction'] = direction
 
         # Extract distance
-        distance_match = re.search(r'Distance.*?:(.*?)(?:\s*Beat|\s*Address|\s*$)', full_text, re.IGNORECASE)
+        distance_match = self._search('distance', full_text, folded)
         if distance_match:
             distance = distance_match.group(1).strip()
             if len(distance) > 1 and len(distance) < 50:
                 place['DirectionDistanceFromPS']['Distance'] = distance
 
         # Extract beat number
-        beat_match = re.search(r'Beat.*?:(.*?)(?:\s*Address|\s*$)', full_text, re.IGNORECASE)
+        beat_match = self._search('beat', full_text, folded)
         if beat_match:
             beat = beat_match.group(1).strip()
             if len(beat) > 0 and len(beat) < 20:
                 place['BeatNo'] = beat
 
         # Extract address - look for address patterns
-        address_match = re.search(r'Address.*?:(.*?)(?:\s*District|\s*State|\s*$)', full_text, re.IGNORECASE)
+        address_match = self._search('address', full_text, folded)
         if address_match:
             address = address_match.group(1).strip()
             if len(address) > 5 and len(address) < 200:
@@ -537,9 +613,9 @@ class FIRExtractionService:
 
         return place
     
-    def _extract_action_taken(self, ocr_data: List[Dict], full_text: str) -> Dict:
+    def _extract_action_taken(self, texts: List[str], full_text: str, folded: str) -> Dict:
         """Extract action taken details"""
-        action_taken = {
+        action_taken: Dict[str, Any] = {
             'RegisteredCaseInvestigation': {
                 'OfficerName': '',
                 'Rank': '',
@@ -555,21 +631,21 @@ class FIRExtractionService:
         }
 
         # Extract officer name - look for name patterns in action section
-        officer_match = re.search(r'(?:Officer|Name).*?:(.*?)(?:\s*Rank|\s*$)', full_text, re.IGNORECASE)
+        officer_match = self._search('officer', full_text, folded)
         if officer_match:
             name = officer_match.group(1).strip()
             if len(name) > 2 and len(name) < 100:
                 action_taken['RegisteredCaseInvestigation']['OfficerName'] = name
 
         # Extract rank
-        rank_match = re.search(r'Rank.*?:(.*?)(?:\s*No|\s*$)', full_text, re.IGNORECASE)
+        rank_match = self._search('rank', full_text, folded)
         if rank_match:
             rank = rank_match.group(1).strip()
             if len(rank) > 2 and len(rank) < 50:
                 action_taken['RegisteredCaseInvestigation']['Rank'] = rank
 
         # Extract officer number
-        no_match = re.search(r'No.*?:(.*?)(?:\s*$)', full_text, re.IGNORECASE)
+        no_match = self._search('no', full_text, folded)
         if no_match:
             no = no_match.group(1).strip()
             if len(no) > 0 and len(no) < 20:
@@ -577,25 +653,22 @@ class FIRExtractionService:
 
         return action_taken
 
-    def _extract_first_information(self, ocr_data: List[Dict], full_text: str) -> str:
+    def _extract_first_information(self, texts: List[str], full_text: str, folded: str) -> str:
         """Extract first information contents"""
         # Look for content after "First Information Contents" or similar patterns
-        content_match = re.search(r'(?:First\s*Information\s*Contents|प्रथम\s*खबर\s*अंतर्गत).*?:(.*?)(?:Action\s*Taken|$)', full_text, re.IGNORECASE | re.DOTALL)
+        content_match = self._search('first_info', full_text, folded)
         if content_match:
             return content_match.group(1).strip()
 
         # Try to find content between complainant signature and action taken
         return ""
 
-    def _extract_accused(self, ocr_data: List[Dict]) -> List[Dict]:
+    def _extract_accused(self, texts: List[str], full_text: str, folded: str) -> List[Dict]:
         """Extract accused details"""
         accused_list = []
 
-        # Look for accused section in the text
-        full_text = ' '.join([item['text'] for item in ocr_data])
-
         # Find accused names - look for patterns after "Accused" or "आरोपी"
-        accused_matches = re.findall(r'(?:Accused|आरोपी).*?(?:Name|नाव).*?:(.*?)(?:Alias|उपनाव|$)', full_text, re.IGNORECASE)
+        accused_matches = self._findall('accused', full_text, folded)
         for name in accused_matches:
             if name.strip():
                 accused_list.append({
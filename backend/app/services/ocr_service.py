@@ -1,39 +1,147 @@
 import pytesseract
 import cv2
+import fitz  # PyMuPDF
 import numpy as np
-from typing import List, Dict, Tuple
+from typing import List, Dict, Optional, Tuple
 import logging
 import os
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import tesserocr  # optional in-process Tesseract bindings
+    from PIL import Image
+except ImportError:
+    tesserocr = None
 
 logger = logging.getLogger(__name__)
 
+# Pages whose embedded text layer has at least this many words skip OCR
+MIN_TEXT_LAYER_WORDS = 10
+
+# Rendered pages waiting for OCR, bounding peak memory to a few pixmaps
+RENDER_QUEUE_SIZE = 4
+
+# Pages are OCRed at RENDER_DPI and re-rendered at RETRY_DPI only when words
+# were found and their mean confidence falls below MIN_MEAN_CONFIDENCE
+RENDER_DPI = 300
+RETRY_DPI = 600
+MIN_MEAN_CONFIDENCE = 0.55
+
+# Images whose estimated noise sigma (measured before CLAHE) is below this
+# skip NLM denoising
+NOISE_SIGMA_THRESHOLD = 8.0
+
+# Images whose background brightness varies more than this across the page
+# are thresholded adaptively rather than with a single global Otsu threshold
+ILLUMINATION_STD_THRESHOLD = 10.0
+
 class OCRService:
     def __init__(self):
         """Initialize Tesseract OCR"""
         # Configure pytesseract
         pytesseract.pytesseract.tesseract_cmd = r'C:\Program Files\Tesseract-OCR\tesseract.exe'  # Adjust path if needed
+
+        # PyMuPDF is not thread-safe, so page rendering is serialized
+        self._render_lock = threading.Lock()
+
+        # Number of pages OCRed in parallel
+        self.max_workers = os.cpu_count() or 1
+
+        # Use OpenCV's SIMD-dispatched kernels and its own thread pool, leaving
+        # one core for the caller. A single page (the upload path) gets the whole
+        # pool; when pages run concurrently OpenCV executes any parallel region
+        # that starts while another is active serially in the calling thread, so
+        # the page workers do not oversubscribe the CPU
+        cv2.setUseOptimized(True)
+        cv2.setNumThreads(max(1, self.max_workers - 1))
+
+        # Reusable CLAHE objects, one per worker since apply() keeps its scratch
+        # buffers on the object
+        self._clahe_pool = queue.Queue()
+        for _ in range(self.max_workers):
+            self._clahe_pool.put(cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8,8)))
+
+        # Long-lived in-process Tesseract engines, since an engine is not
+        # thread-safe; pytesseract is the fallback. Each engine holds an LSTM
+        # model, so only one is created up front (to detect a broken install at
+        # startup) and more are added on demand, up to one per worker
+        self._api_pool = None
+        self._api_count = 0
+        self._api_lock = threading.Lock()
+        if tesserocr is not None:
+            try:
+                api = self._create_api()
+            except Exception as e:
+                # e.g. tessdata not found; keep the service usable via pytesseract
+                logger.warning(f"tesserocr unavailable, falling back to pytesseract: {str(e)}")
+            else:
+                self._api_pool = queue.Queue()
+                self._api_pool.put(api)
+                self._api_count = 1
     
     def preprocess_image(self, image_path: str) -> np.ndarray:
         """Preprocess image for better OCR results"""
-        img = cv2.imread(image_path)
-        
+        return self.preprocess_array(cv2.imread(image_path))
+
+    def preprocess_array(self, bgr: np.ndarray) -> np.ndarray:
+        """Preprocess an already decoded BGR image for better OCR results"""
         # Convert to grayscale
-        gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
-        
-        # Apply denoising
-        denoised = cv2.fastNlMeansDenoising(gray, None, 10, 7, 21)
-        
-        # Apply adaptive thresholding
-        thresh = cv2.adaptiveThreshold(
-            denoised, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, 
-            cv2.THRESH_BINARY, 11, 2
-        )
-        
+        gray = cv2.cvtColor(bgr, cv2.COLOR_BGR2GRAY)
+
+        return self.preprocess_array_gray(gray)
+
+    def estimate_noise(self, gray: np.ndarray) -> float:
+        """Estimate the noise sigma of a grayscale image"""
+        # Median absolute Laplacian is dominated by the background rather than
+        # text edges, so clean pages read near zero however dense the text is.
+        # The median is read off a 256-bin histogram of the saturated |Laplacian|
+        # instead of partitioning a full-size int16 copy
+        laplacian = cv2.convertScaleAbs(cv2.Laplacian(gray, cv2.CV_16S))
+        hist = cv2.calcHist([laplacian], [0], None, [256], [0, 256]).ravel()
+        return float(np.searchsorted(hist.cumsum(), laplacian.size / 2)) / 0.6745
+
+    def estimate_illumination_spread(self, gray: np.ndarray) -> float:
+        """Estimate how unevenly a grayscale image is lit"""
+        # The brightest pixel of each tile on a 32x32 grid approximates the paper
+        # background there; its spread across tiles measures gradients and shadows
+        tiles = min(32, gray.shape[0], gray.shape[1])
+        rows = gray.shape[0] // tiles * tiles
+        cols = gray.shape[1] // tiles * tiles
+        background = gray[:rows, :cols].reshape(tiles, rows // tiles, tiles, cols // tiles).max(axis=(1, 3))
+        return float(cv2.meanStdDev(background)[1][0, 0])
+
+    def preprocess_array_gray(self, gray: np.ndarray) -> np.ndarray:
+        """Preprocess a grayscale image for better OCR results"""
+        # Measure noise on the raw image; CLAHE amplifies it roughly threefold
+        # and NOISE_SIGMA_THRESHOLD is calibrated before enhancement
+        noisy = self.estimate_noise(gray) >= NOISE_SIGMA_THRESHOLD
+
         # Increase contrast
-        clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8,8))
-        enhanced = clahe.apply(thresh)
+        clahe = self._clahe_pool.get()
+        try:
+            enhanced = clahe.apply(gray)
+        finally:
+            self._clahe_pool.put(clahe)
+
+        # Apply denoising, skipped on clean born-digital renders
+        if not noisy:
+            denoised = enhanced
+        else:
+            denoised = cv2.fastNlMeansDenoising(enhanced, None, 10, 7, 21)
         
-        return enhanced
+        # Apply Otsu thresholding, adaptive only for unevenly lit pages. Both
+        # write into the intermediate buffer, which is never the caller's image
+        if self.estimate_illumination_spread(denoised) < ILLUMINATION_STD_THRESHOLD:
+            _, thresh = cv2.threshold(denoised, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU, dst=denoised)
+        else:
+            thresh = cv2.adaptiveThreshold(
+                denoised, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, 
+                cv2.THRESH_BINARY, 11, 2, dst=denoised
+            )
+        
+        return thresh
     
     def extract_text_from_image(self, image_path: str) -> List[Dict]:
         """Extract text with bounding boxes from image"""
@@ -41,67 +149,260 @@ class OCRService:
             # Preprocess image
             processed_img = self.preprocess_image(image_path)
 
-            # Perform OCR using pytesseract
-            data = pytesseract.image_to_data(processed_img, output_type=pytesseract.Output.DICT)
-
-            extracted_data = []
-            n_boxes = len(data['text'])
-            for i in range(n_boxes):
-                if int(data['conf'][i]) > -1:  # Include all detections for debugging
-                    bbox = [
-                        [data['left'][i], data['top'][i]],
-                        [data['left'][i] + data['width'][i], data['top'][i]],
-                        [data['left'][i] + data['width'][i], data['top'][i] + data['height'][i]],
-                        [data['left'][i], data['top'][i] + data['height'][i]]
-                    ]
-                    text = data['text'][i].strip()
-                    if text:  # Only include non-empty text
-                        confidence = data['conf'][i] / 100.0  # Convert to 0-1 scale
-
-                        extracted_data.append({
-                            'bbox': bbox,
-                            'text': text,
-                            'confidence': confidence
-                        })
-
-            return extracted_data
+            return self._recognize(processed_img)
 
         except Exception as e:
             logger.error(f"OCR extraction failed: {str(e)}")
             raise
+
+    def extract_text_from_gray(self, gray: np.ndarray) -> List[Dict]:
+        """Extract text with bounding boxes from a grayscale image array"""
+        try:
+            # Preprocess image
+            processed_img = self.preprocess_array_gray(gray)
+
+            return self._recognize(processed_img)
+
+        except Exception as e:
+            logger.error(f"OCR extraction failed: {str(e)}")
+            raise
+
+    def _recognize(self, processed_img: np.ndarray) -> List[Dict]:
+        """Run OCR on a preprocessed image"""
+        # Perform OCR in-process when tesserocr is available
+        if self._api_pool is not None:
+            return self._ocr_with_tesserocr(processed_img)
+        return self._ocr_with_pytesseract(processed_img)
     
-    def extract_text_from_pdf(self, pdf_path: str) -> Dict[int, List[Dict]]:
-        """Extract text from all pages of PDF using OCR"""
-        import fitz  # PyMuPDF
-        import tempfile
+    def _create_api(self):
+        """Create an in-process Tesseract engine"""
+        return tesserocr.PyTessBaseAPI(oem=tesserocr.OEM.LSTM_ONLY, psm=tesserocr.PSM.AUTO)
 
-        pages_data = {}
+    def _checkout_api(self):
+        """Take an idle Tesseract engine, creating one while under the worker cap"""
+        try:
+            return self._api_pool.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._api_lock:
+            create = self._api_count < self.max_workers
+            if create:
+                self._api_count += 1
+
+        if not create:
+            return self._api_pool.get()
 
         try:
-            # Open PDF with PyMuPDF
+            return self._create_api()
+        except Exception:
+            with self._api_lock:
+                self._api_count -= 1
+            raise
+
+    def _ocr_with_tesserocr(self, processed_img: np.ndarray) -> List[Dict]:
+        """Run OCR on a pooled tesserocr engine and collect word boxes"""
+        extracted_data = []
+
+        api = self._checkout_api()
+        try:
+            api.SetImage(Image.fromarray(processed_img))
+            api.Recognize()
+            iterator = api.GetIterator()
+            if iterator is None:
+                return extracted_data
+
+            level = tesserocr.RIL.WORD
+            for word in tesserocr.iterate_level(iterator, level):
+                # A blank page still yields one position with no word, where
+                # GetUTF8Text raises and BoundingBox returns None
+                if word.Empty(level):
+                    continue
+
+                text = (word.GetUTF8Text(level) or '').strip()
+                if not text:  # Only include non-empty text
+                    continue
+
+                left, top, right, bottom = word.BoundingBox(level)
+                extracted_data.append({
+                    'bbox': ((left, top), (right, top), (right, bottom), (left, bottom)),
+                    'text': text,
+                    'confidence': word.Confidence(level) / 100.0  # Convert to 0-1 scale
+                })
+        finally:
+            self._api_pool.put(api)
+
+        return extracted_data
+
+    def _ocr_with_pytesseract(self, processed_img: np.ndarray) -> List[Dict]:
+        """Run OCR through the tesseract executable and collect word boxes"""
+        tsv = pytesseract.image_to_data(processed_img, output_type=pytesseract.Output.STRING)
+
+        # Split the TSV into columns ourselves; Output.DICT converts every cell
+        # with a per-cell int(float()) in Python
+        rows = [row.split('\t') for row in tsv.strip().split('\n')]
+        header = rows.pop(0)
+        if not rows:
+            return []
+        if len(rows[-1]) < len(header):
+            rows[-1].append('')  # Last row loses its trailing empty text cell
+        columns = dict(zip(header, zip(*rows)))
+
+        # Convert the numeric columns in one pass, truncating like Output.DICT
+        numbers = np.array(
+            [columns['left'], columns['top'], columns['width'], columns['height'], columns['conf']],
+            dtype=np.float64
+        )
+        left, top, width, height = numbers[:4].astype(np.int64)
+        conf = np.trunc(numbers[4])
+        right = left + width
+        bottom = top + height
+
+        extracted_data = []
+        append = extracted_data.append
+        for l, t, r, b, c, text in zip(
+            left.tolist(), top.tolist(), right.tolist(), bottom.tolist(), conf.tolist(), columns['text']
+        ):
+            if c > -1:  # Include all detections for debugging
+                text = text.strip()
+                if text:  # Only include non-empty text
+                    append({
+                        'bbox': ((l, t), (r, t), (r, b), (l, b)),
+                        'text': text,
+                        'confidence': c / 100.0  # Convert to 0-1 scale
+                    })
+
+        return extracted_data
+
+    def _read_text_layer(self, doc, page_num: int, dpi: int) -> Optional[List[Dict]]:
+        """Return a page's embedded text as OCR-style word boxes, or None if too sparse"""
+        with self._render_lock:
+            words = doc[page_num - 1].get_text("words")
+
+        if len(words) < MIN_TEXT_LAYER_WORDS:
+            return None
+
+        # Scale PDF points to the pixel grid OCR would have used
+        scale = dpi / 72
+        extracted_data = []
+        for x0, y0, x1, y1, text, *_ in words:
+            left, top, right, bottom = round(x0 * scale), round(y0 * scale), round(x1 * scale), round(y1 * scale)
+            extracted_data.append({
+                'bbox': ((left, top), (right, top), (right, bottom), (left, bottom)),
+                'text': text,
+                'confidence': 1.0
+            })
+
+        return extracted_data
+
+    def _render_gray(self, doc, page_num: int, dpi: int) -> np.ndarray:
+        """Render a page (1-based) of an open PDF to a grayscale array"""
+        with self._render_lock:
+            pix = doc[page_num - 1].get_pixmap(dpi=dpi, colorspace=fitz.csGRAY)
+            return np.frombuffer(pix.samples, dtype=np.uint8).reshape(pix.height, pix.width)
+
+    def render_page_gray(self, pdf_path: str, page_num: int, dpi: int) -> np.ndarray:
+        """Render a PDF page (1-based) straight to a grayscale array"""
+        with self._render_lock:
             doc = fitz.open(pdf_path)
+        try:
+            return self._render_gray(doc, page_num, dpi)
+        finally:
+            with self._render_lock:
+                doc.close()
+
+    def _ocr_page(self, pdf_path: str, page_num: int, gray: np.ndarray, dpi: int) -> List[Dict]:
+        """OCR a rendered page, re-rendering it at RETRY_DPI if it reads poorly"""
+        page_data = self.extract_text_from_gray(gray)
+
+        # Retry at a higher resolution when the page was read poorly; pages with
+        # no words at all are blank and have nothing to recover
+        if dpi < RETRY_DPI and page_data:
+            mean_confidence = sum(item['confidence'] for item in page_data) / len(page_data)
+            if mean_confidence < MIN_MEAN_CONFIDENCE:
+                logger.info(f"Page {page_num} mean confidence {mean_confidence:.2f}, re-rendering at {RETRY_DPI} dpi")
+                page_data = self.extract_text_from_gray(self.render_page_gray(pdf_path, page_num, RETRY_DPI))
+
+        return page_data
 
-            for page_num in range(len(doc)):
-                page = doc[page_num]
+    def extract_page(self, pdf_path: str, page_num: int, dpi: int = RENDER_DPI) -> List[Dict]:
+        """Extract text from a single PDF page (1-based), using OCR only without a text layer"""
+        try:
+            with self._render_lock:
+                doc = fitz.open(pdf_path)
+            try:
+                page_data = self._read_text_layer(doc, page_num, dpi)
+                if page_data is None:
+                    page_data = self._ocr_page(pdf_path, page_num, self._render_gray(doc, page_num, dpi), dpi)
+                return page_data
+            finally:
+                with self._render_lock:
+                    doc.close()
 
-                # Render page to image
-                pix = page.get_pixmap(dpi=600)
-                img_data = pix.tobytes("png")
+        except Exception as e:
+            logger.error(f"PDF page {page_num} processing failed: {str(e)}")
+            raise
 
-                # Save to temporary file
-                with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as tmp:
-                    tmp.write(img_data)
-                    tmp.close()  # Explicitly close the file
+    def extract_first_page(self, pdf_path: str, dpi: int = RENDER_DPI) -> Dict[int, List[Dict]]:
+        """Extract text from only the first page of PDF using OCR"""
+        return {1: self.extract_page(pdf_path, 1, dpi)}
+
+    def _render_pages(self, pdf_path: str, dpi: int, rendered: queue.Queue, consumers: int) -> Dict[int, List[Dict]]:
+        """Render pages without a text layer into a queue, then one stop marker per consumer"""
+        text_pages = {}
+        try:
+            with self._render_lock:
+                doc = fitz.open(pdf_path)
+            try:
+                for page_num in range(1, len(doc) + 1):
+                    # Born-digital pages are read directly and never queued for OCR
+                    page_data = self._read_text_layer(doc, page_num, dpi)
+                    if page_data is not None:
+                        text_pages[page_num] = page_data
+                        continue
+
+                    rendered.put((page_num, self._render_gray(doc, page_num, dpi)))
+            finally:
+                with self._render_lock:
+                    doc.close()
+        finally:
+            for _ in range(consumers):
+                rendered.put(None)
+
+        return text_pages
+
+    def _ocr_rendered_pages(self, pdf_path: str, dpi: int, rendered: queue.Queue) -> Dict[int, List[Dict]]:
+        """OCR rendered pages from a queue until a stop marker arrives"""
+        pages_data = {}
+        try:
+            while (item := rendered.get()) is not None:
+                page_num, gray = item
+                pages_data[page_num] = self._ocr_page(pdf_path, page_num, gray, dpi)
+        except Exception:
+            # Keep draining so the renderer is never left blocked on a full queue
+            while rendered.get() is not None:
+                pass
+            raise
+
+        return pages_data
+
+    def extract_text_from_pdf(self, pdf_path: str, dpi: int = RENDER_DPI) -> Dict[int, List[Dict]]:
+        """Extract text from all pages of PDF, rendering ahead while workers OCR"""
+        try:
+            rendered = queue.Queue(maxsize=RENDER_QUEUE_SIZE)
 
-                    # Extract text from page image
-                    page_data = self.extract_text_from_image(tmp.name)
-                    pages_data[page_num + 1] = page_data
+            with ThreadPoolExecutor(max_workers=self.max_workers + 1) as executor:
+                renderer = executor.submit(self._render_pages, pdf_path, dpi, rendered, self.max_workers)
+                workers = [
+                    executor.submit(self._ocr_rendered_pages, pdf_path, dpi, rendered)
+                    for _ in range(self.max_workers)
+                ]
 
-                    # Clean up temp file
-                    os.unlink(tmp.name)
+                pages_data = renderer.result()
+                for worker in workers:
+                    pages_data.update(worker.result())
 
-            doc.close()
-            return pages_data
+            return dict(sorted(pages_data.items()))
 
         except Exception as e:
             logger.error(f"PDF processing failed: {str(e)}")
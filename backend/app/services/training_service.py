@@ -1,11 +1,38 @@
-import json
+import orjson
+import os
 import re
+import uuid
+from collections import Counter
 from pathlib import Path
-from typing import List, Dict
+from typing import Dict, Iterable, Iterator, List, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
 
+def _dig(data, *keys):
+    """Look up a nested key path, returning '' if any level is missing"""
+    for key in keys:
+        data = data.get(key) if isinstance(data, dict) else None
+    return data or ''
+
+def _write_atomic(path: Path, data: bytes):
+    """Write a file via a temporary sibling so readers never see a partial file"""
+    # A uniquely named temp file per writer, so concurrent writers to the same
+    # target never share (and interleave into) one temp file
+    tmp = path.with_name(f"{path.name}.{uuid.uuid4().hex}.tmp")
+    try:
+        with tmp.open('xb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
 class TrainingService:
     def __init__(self):
         self.training_dir = Path("training_data")
@@ -22,8 +49,10 @@ class TrainingService:
             }
             
             sample_file = self.training_dir / f"sample_{file_id}.json"
-            with sample_file.open('w', encoding='utf-8') as f:
-                json.dump(sample, f, ensure_ascii=False, indent=2)
+            _write_atomic(
+                sample_file,
+                orjson.dumps(sample, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+            )
             
             logger.info(f"Training sample saved: {file_id}")
             return True
@@ -32,32 +61,44 @@ class TrainingService:
             logger.error(f"Failed to save training sample: {str(e)}")
             return False
     
-    def get_training_samples(self) -> List[Dict]:
-        """Load all training samples"""
-        samples = []
-        
-        for sample_file in self.training_dir.glob("sample_*.json"):
+    def _sample_paths(self) -> Iterator[str]:
+        """Yield the paths of all training sample files"""
+        with os.scandir(self.training_dir) as entries:
+            for entry in entries:
+                if entry.name.startswith("sample_") and entry.name.endswith(".json"):
+                    yield entry.path
+
+    def iter_training_samples(self) -> Iterator[Dict]:
+        """Lazily load training samples one file at a time"""
+        for path in self._sample_paths():
             try:
-                with sample_file.open('r', encoding='utf-8') as f:
-                    samples.append(json.load(f))
+                with open(path, 'rb') as f:
+                    sample = orjson.loads(f.read())
             except Exception as e:
-                logger.error(f"Failed to load {sample_file}: {str(e)}")
-        
-        return samples
+                logger.error(f"Failed to load {path}: {str(e)}")
+                continue
+            yield sample
+
+    def get_training_samples(self) -> List[Dict]:
+        """Load all training samples"""
+        return list(self.iter_training_samples())
     
     def retrain_model(self) -> Dict:
         """Retrain extraction model with new samples"""
-        samples = self.get_training_samples()
+        try:
+            # Analyze training samples as they stream off disk, counting only
+            # the ones that actually load
+            improved_patterns, sample_count = self._analyze_training_samples(self.iter_training_samples())
 
-        if len(samples) < 5:
-            return {
-                'status': 'insufficient_data',
-                'message': f'Need at least 5 samples, have {len(samples)}'
-            }
+            if sample_count < 5:
+                return {
+                    'status': 'insufficient_data',
+                    'message': f'Need at least 5 samples, have {sample_count}'
+                }
 
-        try:
-            # Analyze training samples to improve extraction patterns
-            improved_patterns = self._analyze_training_samples(samples)
+            # Make sure every pattern compiles, so an invalid one is never persisted
+            for pattern in improved_patterns.values():
+                re.compile(pattern)
 
             # Update the extraction service with improved patterns
             from app.services.extraction_service import FIRExtractionService
@@ -69,8 +110,8 @@ class TrainingService:
 
             return {
                 'status': 'success',
-                'samples_used': len(samples),
-                'message': f'Model retrained successfully with {len(samples)} samples! Extraction patterns updated.'
+                'samples_used': sample_count,
+                'message': f'Model retrained successfully with {sample_count} samples! Extraction patterns updated.'
             }
 
         except Exception as e:
@@ -80,63 +121,62 @@ class TrainingService:
                 'message': f'Retraining failed: {str(e)}'
             }
 
-    def _analyze_training_samples(self, samples: List[Dict]) -> Dict:
-        """Analyze training samples to generate improved extraction patterns"""
+    def _analyze_training_samples(self, samples: Iterable[Dict]) -> Tuple[Dict, int]:
+        """Analyze training samples to generate improved extraction patterns and count them"""
         improved_patterns = {}
-
-        # Analyze FIR numbers
-        fir_numbers = []
+        sample_count = 0
+
+        # Count FIR numbers, districts, police stations and complainant names
+        # in a single pass over the samples
+        fir_numbers = Counter()
+        districts = Counter()
+        ps_stations = Counter()
+        names = Counter()
         for sample in samples:
-            fir_no = sample.get('ground_truth', {}).get('FIR', {}).get('FIRNo', '')
-            if fir_no and fir_no != '':
-                fir_numbers.append(fir_no)
+            sample_count += 1
+            fir = _dig(sample, 'ground_truth', 'FIR')
+
+            fir_no = _dig(fir, 'FIRNo')
+            if fir_no:
+                fir_numbers[fir_no] += 1
+
+            district = _dig(fir, 'District')
+            if district:
+                districts[district] += 1
+
+            ps = _dig(fir, 'PoliceStation')
+            if ps:
+                ps_stations[ps] += 1
+
+            name = _dig(sample, 'ground_truth', 'ComplainantInformant', 'Name')
+            if name:
+                names[name] += 1
 
         if fir_numbers:
             # Create more flexible FIR number pattern
             improved_patterns['fir_no'] = r'FIR\s*No\.?\s*:?\s*(\d{4})'
 
-        # Analyze district patterns
-        districts = []
-        for sample in samples:
-            district = sample.get('ground_truth', {}).get('FIR', {}).get('District', '')
-            if district and district != '':
-                districts.append(re.escape(district))
-
         if districts:
-            # Create district pattern from training data
-            district_pattern = '|'.join(districts[:5])  # Use top 5 districts
+            # Create district pattern from the 5 most frequent districts
+            district_pattern = '|'.join(re.escape(district) for district, _ in districts.most_common(5))
             improved_patterns['district'] = f'(?:District|जिला).*?:\\s*({district_pattern})'
 
-        # Analyze police station patterns
-        ps_stations = []
-        for sample in samples:
-            ps = sample.get('ground_truth', {}).get('FIR', {}).get('PoliceStation', '')
-            if ps and ps != '':
-                ps_stations.append(re.escape(ps))
-
         if ps_stations:
-            ps_pattern = '|'.join(ps_stations[:5])  # Use top 5 police stations
+            # Use the 5 most frequent police stations
+            ps_pattern = '|'.join(re.escape(ps) for ps, _ in ps_stations.most_common(5))
             improved_patterns['police_station'] = f'(?:P\.S\.|Police Station|थाने).*?:\\s*({ps_pattern})'
 
-        # Analyze complainant names
-        names = []
-        for sample in samples:
-            name = sample.get('ground_truth', {}).get('ComplainantInformant', {}).get('Name', '')
-            if name and name != '':
-                names.append(re.escape(name))
-
         if names:
-            name_pattern = '|'.join(names[:3])  # Use top 3 names as examples
+            # Use the 3 most frequent names as examples
+            name_pattern = '|'.join(re.escape(name) for name, _ in names.most_common(3))
             improved_patterns['complainant_name'] = f'(?:Name|नाव).*?:\\s*({name_pattern}|\\w+(?:\\s+\\w+)*)'
 
-        return improved_patterns
+        return improved_patterns, sample_count
 
     def _save_improved_patterns(self, patterns: Dict):
         """Save improved patterns to file"""
         try:
-            import json
             pattern_file = self.training_dir / "improved_patterns.json"
-            with pattern_file.open('w', encoding='utf-8') as f:
-                json.dump(patterns, f, ensure_ascii=False, indent=2)
+            _write_atomic(pattern_file, orjson.dumps(patterns, option=orjson.OPT_INDENT_2))
         except Exception as e:
             logger.error(f"Failed to save patterns: {str(e)}")
\ No newline at end of file